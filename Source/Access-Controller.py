@@ -3,6 +3,7 @@ import serial
 import time
 import json
 import os
+import queue
 from PyQt6.QtWidgets import *
 from PyQt6.QtCore import *
 from PyQt6.QtGui import *
@@ -10,70 +11,658 @@ import serial.tools.list_ports
 
 BAUD_RATE = 115200
 TAGS_FILE = "allowed_tags.json"
+_DEFAULT_TAGS = ("0001234567", "0009876543", "0005555555", "12345", "67890")
+
+
+def _canon(tag):
+    """Canonical tag form: no surrounding whitespace or zero-padding"""
+    return tag.strip().lstrip('0') or '0'
+
+
+# Pulse-animation tick template; %-format is cheaper than an f-string in
+# the per-frame callback
+_ICON_TMPL = "font-size: %dpx; color: %s; background: transparent; border: none; padding: 0px; margin: 0px;"
+
+# Bloom-filter sizing for the allowed-tag prefilter
+_BLOOM_BITS = 1024
+_BLOOM_SEEDS = (0, 0x9E3779B9, 0x85EBCA6B)
+
+# Application-wide stylesheet, built once at import time
+_STYLESHEET = """
+    /* Main Window */
+    QMainWindow {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                                    stop:0 rgba(18, 18, 28, 220), 
+                                    stop:1 rgba(28, 28, 48, 220));
+        border: 1px solid rgba(70, 70, 100, 100);
+        border-radius: 15px;
+    }
+    
+    /* Main Screen */
+    QWidget#mainScreen {
+        background: transparent;
+        border-radius: 15px;
+    }
+    
+    /* Settings Panel - NO BACKGROUND */
+    QWidget#settingsPanel {
+        background: transparent;
+        border-radius: 15px;
+    }
+    
+    /* Scroll Area Content - Remove all backgrounds */
+    QWidget#scrollContent {
+        background: transparent;
+    }
+    
+    /* Footer Label */
+    QLabel#footerLabel {
+        font-size: 10px;
+        color: rgba(255, 255, 255, 100);
+        font-style: italic;
+        padding: 5px;
+    }
+    
+    /* Settings Title - PROPERLY CENTERED */
+    QLabel#settingsTitle {
+        font-size: 22px;
+        font-weight: bold;
+        color: #ffffff;
+        padding: 0px;
+        margin: 0px;
+        qproperty-alignment: AlignCenter;
+    }
+    
+    /* Settings Button */
+    QPushButton#settingsBtn {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                    stop:0 #2d3436, stop:1 #222831);
+        color: #ffffff;
+        font-size: 18px;
+        border: 1px solid #4a4a6a;
+        border-radius: 8px;
+        padding: 0px;
+    }
+    
+    QPushButton#settingsBtn:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                    stop:0 #3742fa, stop:1 #5352ed);
+        border-color: #70a1ff;
+    }
+    
+    /* Status Indicator */
+    QLabel#statusIndicator {
+        font-size: 11px;
+        padding: 4px 10px;
+        border-radius: 8px;
+        background-color: #ff4757;
+        color: white;
+        font-weight: bold;
+    }
+
+    QLabel#statusIndicator[state="connected"] {
+        background-color: #1dd1a1;
+    }
+    
+    /* Status Card */
+    QFrame#statusCard {
+        background: qradialgradient(cx:0.5, cy:0.5, radius:1,
+                                    fx:0.5, fy:0.5,
+                                    stop:0 rgba(40, 40, 60, 200),
+                                    stop:1 rgba(25, 25, 40, 250));
+        border-radius: 12px;
+        border: 1px solid #2d3436;
+    }
+    
+    /* Scan Icon */
+    QLabel#scanIcon {
+        font-size: 48px;
+        color: #70a1ff;
+        background: transparent;
+        border: none;
+        padding: 0px;
+        margin: 0px;
+    }
+    
+    /* Scan Label */
+    QLabel#scanLabel {
+        font-size: 17px;
+        font-weight: bold;
+        color: #ffffff;
+        padding: 4px;
+        background: transparent;
+    }
+    
+    /* Tag Display */
+    QLabel#tagDisplay {
+        font-size: 13px;
+        font-family: 'Courier New', monospace;
+        color: #70a1ff;
+        padding: 5px 8px;
+        background-color: rgba(30, 30, 45, 0.8);
+        border-radius: 5px;
+        border: 1px solid #3742fa;
+    }
+    
+    /* Combined Scan Control Button */
+    QPushButton#scanControlBtn {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                    stop:0 #3742fa, stop:1 #5352ed);
+        color: white;
+        font-size: 14px;
+        font-weight: bold;
+        border: none;
+        border-radius: 8px;
+    }
+    
+    QPushButton#scanControlBtn:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                    stop:0 #5352ed, stop:1 #6c5ce7);
+    }
+    
+    QPushButton#scanControlBtn:disabled {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                    stop:0 #4a4a4a, stop:1 #3a3a3a);
+        color: #777777;
+    }
+
+    QPushButton#scanControlBtn[mode="stop"] {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                    stop:0 #ff6b6b, stop:1 #ee5a52);
+    }
+
+    QPushButton#scanControlBtn[mode="stop"]:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                    stop:0 #ff5252, stop:1 #ff3838);
+    }
+    
+    /* Activity Label */
+    QLabel#activityLabel {
+        font-size: 13px;
+        font-weight: bold;
+        color: #70a1ff;
+        padding: 3px 0;
+    }
+    
+    /* Activity List */
+    QListWidget#activityList {
+        background-color: rgba(30, 30, 45, 0.8);
+        border: 1px solid #2d3436;
+        border-radius: 8px;
+        font-size: 10px;
+        padding: 5px;
+        color: #dddddd;
+    }
+    
+    QListWidget#activityList::item {
+        padding: 3px;
+        border-bottom: 1px solid rgba(45, 52, 54, 0.5);
+        background-color: transparent;
+    }
+    
+    QListWidget#activityList::item:last-child {
+        border-bottom: none;
+    }
+    
+    QListWidget#activityList::item:selected {
+        background-color: rgba(112, 161, 255, 0.3);
+        color: white;
+    }
+    
+    /* Back Button */
+    QPushButton#backBtn {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                    stop:0 #2d3436, stop:1 #222831);
+        color: #70a1ff;
+        font-size: 18px;
+        border: 1px solid #4a4a6a;
+        border-radius: 8px;
+    }
+    
+    QPushButton#backBtn:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                    stop:0 #3742fa, stop:1 #5352ed);
+        border-color: #70a1ff;
+    }
+    
+    /* Scroll Area */
+    QScrollArea#scrollArea {
+        border: none;
+        background: transparent;
+    }
+    
+    QScrollBar:vertical {
+        background: #2d3436;
+        width: 6px;
+        border-radius: 3px;
+    }
+    
+    QScrollBar::handle:vertical {
+        background: #70a1ff;
+        border-radius: 3px;
+        min-height: 15px;
+    }
+    
+    QScrollBar::handle:vertical:hover {
+        background: #5352ed;
+    }
+    
+    /* Settings Group Box - Keep the box styling but remove surrounding gray */
+    QGroupBox#settingsGroupBox {
+        font-size: 13px;
+        font-weight: bold;
+        color: #ffffff;
+        border: 2px solid #2d3436;
+        border-radius: 10px;
+        padding: 12px;
+        color: #70a1ff;
+        margin-top: 5px;
+        background: qradialgradient(cx:0.5, cy:0.5, radius:1,
+                                    fx:0.5, fy:0.5,
+                                    stop:0 rgba(40, 40, 60, 180),
+                                    stop:1 rgba(25, 25, 40, 200));
+    }
+    
+    QGroupBox#settingsGroupBox::title {
+        color: #70a1ff;
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 10px 0 10px;
+    }
+    
+    /* Combo Box */
+    QComboBox {
+        background-color: rgba(40, 40, 60, 0.8);
+        border: 1px solid #4a4a6a;
+        border-radius: 6px;
+        padding: 6px;
+        font-size: 11px;
+        color: #ffffff;
+    }
+    
+    QComboBox:hover {
+        border-color: #70a1ff;
+    }
+    
+    QComboBox::drop-down {
+        border: none;
+    }
+    
+    QComboBox::down-arrow {
+        image: none;
+        border-left: 4px solid transparent;
+        border-right: 4px solid transparent;
+        border-top: 4px solid #70a1ff;
+    }
+    
+    QComboBox QAbstractItemView {
+        background-color: #1a1a2e;
+        border: 1px solid #70a1ff;
+        color: #ffffff;
+        selection-background-color: #3742fa;
+    }
+    
+    /* Refresh Button */
+    QPushButton#refreshBtn {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                    stop:0 #3742fa, stop:1 #5352ed);
+        color: white;
+        border: none;
+        border-radius: 6px;
+        font-size: 14px;
+    }
+    
+    QPushButton#refreshBtn:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                    stop:0 #5352ed, stop:1 #6c5ce7);
+    }
+    
+    /* Connection Status */
+    QLabel#connectionStatus {
+        color: #7f8c8d;
+        font-size: 10px;
+        font-style: italic;
+    }
+
+    QLabel#connectionStatus[state="connected"] {
+        color: #1dd1a1;
+        font-weight: bold;
+        font-style: normal;
+    }
+    
+    /* Tag List */
+    QListWidget#tagList {
+        background-color: rgba(40, 40, 60, 0.8);
+        border: 1px solid #4a4a6a;
+        border-radius: 6px;
+        font-size: 11px;
+        padding: 5px;
+        color: #dddddd;
+    }
+    
+    QListWidget#tagList::item {
+        padding: 5px;
+        background-color: rgba(30, 30, 45, 0.6);
+        margin: 2px;
+        border-radius: 4px;
+        border-left: 3px solid #3742fa;
+    }
+    
+    QListWidget#tagList::item:selected {
+        background-color: rgba(112, 161, 255, 0.3);
+        color: white;
+        border-left: 3px solid #ff6b6b;
+    }
+    
+    /* Line Edit */
+    QLineEdit {
+        background-color: rgba(40, 40, 60, 0.8);
+        border: 1px solid #4a4a6a;
+        border-radius: 6px;
+        padding: 6px;
+        font-size: 11px;
+        color: #ffffff;
+        selection-background-color: #3742fa;
+    }
+    
+    QLineEdit:focus {
+        border-color: #70a1ff;
+        border-width: 2px;
+    }
+    
+    QLineEdit::placeholder {
+        color: #7f8c8d;
+    }
+    
+    /* Add Button */
+    QPushButton#addBtn {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                    stop:0 #1dd1a1, stop:1 #10ac84);
+        color: white;
+        border: none;
+        border-radius: 6px;
+        font-weight: bold;
+        padding: 0 12px;
+        font-size: 11px;
+    }
+    
+    QPushButton#addBtn:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                    stop:0 #26de85, stop:1 #20bf6b);
+    }
+    
+    /* Remove Button */
+    QPushButton#removeBtn {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                    stop:0 #ff6b6b, stop:1 #ee5a52);
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 8px 16px;
+        font-weight: bold;
+        font-size: 11px;
+    }
+    
+    QPushButton#removeBtn:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                    stop:0 #ff5252, stop:1 #ff3838);
+    }
+    
+    QPushButton#removeBtn:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                    stop:0 #c0392b, stop:1 #a93226);
+    }
+"""
+
+
+class RFIDReader(QThread):
+    """Reads newline-terminated tags from the serial port off the GUI thread"""
+    tag_read = pyqtSignal(str)
+
+    def __init__(self, esp, parent=None):
+        super().__init__(parent)
+        self.esp = esp
+        self.buffer = bytearray()
+        self._running = True
+
+    def _consume_lines(self):
+        """Pop all complete newline-terminated frames from the buffer"""
+        lines = []
+        idx = self.buffer.find(b'\n')
+        while idx != -1:
+            lines.append(bytes(self.buffer[:idx]))
+            del self.buffer[:idx + 1]
+            idx = self.buffer.find(b'\n')
+        return lines
+
+    def run(self):
+        while self._running:
+            try:
+                data = self.esp.read(self.esp.in_waiting or 1)
+            except (serial.SerialException, OSError):
+                break
+            if not data:
+                continue
+            self.buffer.extend(data)
+            for line in self._consume_lines():
+                tag = line.decode('ascii', 'ignore').strip()
+                if tag:
+                    self.tag_read.emit(tag)
+
+    def stop(self):
+        self._running = False
+
+
+class SerialWriter(QThread):
+    """Drains queued outbound bytes so UART latency never blocks the GUI"""
+
+    def __init__(self, esp, parent=None):
+        super().__init__(parent)
+        self.esp = esp
+        self.queue = queue.Queue()
+        self._running = True
+
+    def send(self, data):
+        self.queue.put_nowait(data)
+
+    def run(self):
+        while self._running:
+            try:
+                data = self.queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            if data is None:
+                break
+            try:
+                self.esp.write(data)
+            except (serial.SerialException, OSError):
+                break
+
+    def stop(self):
+        self._running = False
+        self.queue.put_nowait(None)
 
 
 class RFIDApp(QMainWindow):
     def __init__(self):
         super().__init__()
-        self.allowed_tags = self.load_tags_from_json()
+        # Edits go to the mutable set; allowed_tags is an immutable snapshot
+        # the reader thread can probe without locking (attribute rebinding
+        # is atomic, so it always sees a consistent frozenset)
+        self._allowed_mutable = {sys.intern(_canon(t)) for t in self.load_tags_from_json()}
+        self.allowed_tags = frozenset(self._allowed_mutable)
+        self._rebuild_bloom()
+        # Version counter so the settings list only rebuilds after real edits
+        self._tags_version = 0
+        self._tag_list_version = -1
         self.scanning_enabled = False
-        self.buffer = ""
+        self.buffer = bytearray()
         self.esp = None
+        self._reader = None
+        self._writer = None
+        # Dialogs are built once on first use and reused
+        self._message_dialog = None
+        self._message_dialog_label = None
+        self._remove_dialog = None
+        self._remove_dialog_label = None
+        self._pending_remove_tag = None
+        self._pending_remove_item = None
+        # Timestamp string memoized per second for burst logging
+        self._ts_last_sec = 0
+        self._ts_str = ""
+        # One QColor per activity type instead of an allocation per entry
+        self._activity_colors = {
+            "success": QColor("#1dd1a1"),
+            "error": QColor("#ff4757"),
+            "info": QColor("#70a1ff"),
+        }
+        # Port enumeration is slow (OS device-tree walk); cache briefly
+        self._ports_cache = (0.0, [])
+        self._ports_shown = None
+        # Coalesce bursts of tag edits into a single disk write
+        self._tags_dirty = False
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_tags)
+        # Coalesce keyboard-wedge keystrokes into one display update
+        self._buffer_timer = QTimer(self)
+        self._buffer_timer.setSingleShot(True)
+        self._buffer_timer.setInterval(15)
+        self._buffer_timer.timeout.connect(self._flush_buffer_display)
+        # One reusable result-reset timer; restarting it on each scan also
+        # stops a stale reset from wiping a fresh result
+        self._reset_timer = QTimer(self)
+        self._reset_timer.setSingleShot(True)
+        self._reset_timer.setInterval(2000)
+        self._reset_timer.timeout.connect(self.reset_scan_display)
+        # One reusable pulse animation; per scan only the color changes
+        self._pulse_color = "#70a1ff"
+        self._pulse_anim = QVariantAnimation(self)
+        self._pulse_anim.setDuration(300)
+        self._pulse_anim.setLoopCount(2)
+        self._pulse_anim.setStartValue(48)
+        self._pulse_anim.setKeyValueAt(0.5, 56)
+        self._pulse_anim.setEndValue(48)
+        self._pulse_anim.valueChanged.connect(self._pulse_tick)
+        # Scan-result styles keyed by outcome (True/False/None=idle), built
+        # once so the per-scan path never formats stylesheet strings
+        self._scan_label_qss = {
+            True: "font-size: 15px; font-weight: bold; color: #1dd1a1; padding: 4px; background: transparent;",
+            False: "font-size: 15px; font-weight: bold; color: #ff4757; padding: 4px; background: transparent;",
+            None: "font-size: 17px; font-weight: bold; color: #ffffff; padding: 4px; background: transparent;",
+        }
+        self._scan_icon_qss = {
+            True: "font-size: 48px; color: #1dd1a1; background: transparent; border: none; padding: 0px; margin: 0px;",
+            False: "font-size: 48px; color: #ff4757; background: transparent; border: none; padding: 0px; margin: 0px;",
+            None: "font-size: 48px; color: #70a1ff; background: transparent; border: none; padding: 0px; margin: 0px;",
+        }
+        self._tag_display_qss = {
+            True: "color: #1dd1a1; border-color: #1dd1a1; background-color: rgba(30, 30, 45, 0.8);",
+            False: "color: #ff4757; border-color: #ff4757; background-color: rgba(30, 30, 45, 0.8);",
+            None: "color: #70a1ff; border-color: #3742fa; background-color: rgba(30, 30, 45, 0.8);",
+        }
         self.initUI()
+        # Defer the first-run file creation until after the UI has painted
+        QTimer.singleShot(0, self._ensure_tags_file)
 
     # -------------------------
     # JSON FILE HANDLING
     # -------------------------
     def load_tags_from_json(self):
-        """Load allowed tags from JSON file, create if doesn't exist"""
+        """Load allowed tags from JSON file, fall back to defaults"""
         try:
-            if os.path.exists(TAGS_FILE):
-                with open(TAGS_FILE, 'r') as f:
-                    tags = json.load(f)
-                    # Ensure we have a list with default tags if file is empty/corrupt
-                    if isinstance(tags, list):
-                        return tags
-                    else:
-                        # If file exists but doesn't contain a list, create default
-                        default_tags = ["0001234567", "0009876543", "0005555555", "12345", "67890"]
-                        self.save_tags_to_json(default_tags)
-                        return default_tags
-            else:
-                # Create JSON file with default tags
-                default_tags = ["0001234567", "0009876543", "0005555555", "12345", "67890"]
-                self.save_tags_to_json(default_tags)
-                return default_tags
-        except (json.JSONDecodeError, IOError) as e:
+            # Single open, no exists() pre-check; bytes take json's fast path
+            with open(TAGS_FILE, 'rb') as f:
+                tags = json.loads(f.read())
+            # Ensure we have a list, fall back to defaults if corrupt
+            if isinstance(tags, list):
+                return tags
+            return _DEFAULT_TAGS
+        except FileNotFoundError:
+            return _DEFAULT_TAGS
+        except (json.JSONDecodeError, OSError) as e:
             print(f"Error loading tags: {e}")
-            # Return default tags and try to create file
-            default_tags = ["0001234567", "0009876543", "0005555555", "12345", "67890"]
-            self.save_tags_to_json(default_tags)
-            return default_tags
+            return _DEFAULT_TAGS
+
+    def _ensure_tags_file(self):
+        """Create the tags file with current contents if it is missing"""
+        if not os.path.exists(TAGS_FILE):
+            self.save_tags_to_json(self.allowed_tags)
 
     def save_tags_to_json(self, tags):
-        """Save allowed tags to JSON file"""
+        """Save allowed tags to JSON file (single atomic write)"""
         try:
-            with open(TAGS_FILE, 'w') as f:
-                json.dump(tags, f, indent=2)
+            data = json.dumps(sorted(tags), indent=2).encode()
+            tmp = TAGS_FILE + ".tmp"
+            with open(tmp, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, TAGS_FILE)
         except IOError as e:
             print(f"Error saving tags: {e}")
 
     def add_tag_to_json(self, tag):
-        """Add a new tag to both memory and JSON file"""
-        if tag not in self.allowed_tags:
-            self.allowed_tags.append(tag)
-            self.save_tags_to_json(self.allowed_tags)
-            return True
-        return False
+        """Add a new tag to memory and schedule a JSON flush"""
+        tag = sys.intern(_canon(tag))
+        if tag in self._allowed_mutable:
+            return False
+        self._allowed_mutable.add(tag)
+        self._bloom_add(tag)
+        self._publish_tags()
+        return True
 
     def remove_tag_from_json(self, tag):
-        """Remove tag from both memory and JSON file"""
-        if tag in self.allowed_tags:
-            self.allowed_tags.remove(tag)
-            self.save_tags_to_json(self.allowed_tags)
+        """Remove tag from memory and schedule a JSON flush"""
+        tag = _canon(tag)
+        if tag in self._allowed_mutable:
+            self._allowed_mutable.discard(tag)
+            self._rebuild_bloom()
+            self._publish_tags()
             return True
         return False
 
+    def _publish_tags(self):
+        """Atomically swap in a fresh snapshot and schedule persistence"""
+        self.allowed_tags = frozenset(self._allowed_mutable)
+        self._tags_version += 1
+        self._mark_tags_dirty()
+
+    # -------------------------
+    # BLOOM PREFILTER
+    # -------------------------
+    def _bloom_add(self, tag):
+        bloom = self._tag_bloom
+        h = hash(tag)
+        for seed in _BLOOM_SEEDS:
+            bit = (h ^ seed) % _BLOOM_BITS
+            bloom[bit >> 3] |= 1 << (bit & 7)
+
+    def _rebuild_bloom(self):
+        """Recompute the prefilter from scratch (needed after removals)"""
+        self._tag_bloom = bytearray(_BLOOM_BITS // 8)
+        for tag in self._allowed_mutable:
+            self._bloom_add(tag)
+
+    def _bloom_might_contain(self, tag):
+        """False is definitive; True still needs the set lookup"""
+        bloom = self._tag_bloom
+        h = hash(tag)
+        for seed in _BLOOM_SEEDS:
+            bit = (h ^ seed) % _BLOOM_BITS
+            if not bloom[bit >> 3] & (1 << (bit & 7)):
+                return False
+        return True
+
+    def _mark_tags_dirty(self):
+        """Debounce persistence so a burst of edits does one disk write"""
+        self._tags_dirty = True
+        self._flush_timer.start(250)
+
+    def _flush_tags(self):
+        """Write pending tag changes to disk, if any"""
+        if self._tags_dirty:
+            self._tags_dirty = False
+            self.save_tags_to_json(self.allowed_tags)
+
     # -------------------------
     # MAIN UI SETUP
     # -------------------------
@@ -132,6 +721,7 @@ class RFIDApp(QMainWindow):
         # Status indicator at top
         self.status_indicator = QLabel("● Disconnected")
         self.status_indicator.setObjectName("statusIndicator")
+        self.status_indicator.setProperty("state", "disconnected")
         self.status_indicator.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         self.scan_icon = QLabel("📱")
@@ -155,6 +745,7 @@ class RFIDApp(QMainWindow):
         # Combined Start/Stop Button
         self.scan_control_btn = QPushButton("▶ Start Scanning")
         self.scan_control_btn.setObjectName("scanControlBtn")
+        self.scan_control_btn.setProperty("mode", "start")
         self.scan_control_btn.setFixedSize(200, 45)
         self.scan_control_btn.clicked.connect(self.toggle_scanning)
 
@@ -166,6 +757,8 @@ class RFIDApp(QMainWindow):
         self.activity_list = QListWidget()
         self.activity_list.setFixedHeight(140)
         self.activity_list.setObjectName("activityList")
+        # Rows are all single-line; lets Qt skip per-item size measurement
+        self.activity_list.setUniformItemSizes(True)
 
         # Footer with credit
         footer_label = QLabel("rfid access control be @edward1stark")
@@ -190,6 +783,20 @@ class RFIDApp(QMainWindow):
 
         self.main_layout.addWidget(self.main_screen)
 
+        # Settings panel is built lazily on first open
+        self.settings_panel = None
+
+        # Connect signals
+        self.settings_btn.clicked.connect(self.open_settings_panel)
+
+        # Install event filter for keyboard
+        self.installEventFilter(self)
+
+        # Show main screen
+        self.show_main_screen()
+
+    def _build_settings_panel(self):
+        """Construct the settings panel; deferred until first open"""
         # --- SETTINGS PANEL ---
         self.settings_panel = QWidget()
         self.settings_panel.setObjectName("settingsPanel")  # Changed ID
@@ -265,7 +872,8 @@ class RFIDApp(QMainWindow):
         
         port_layout.addLayout(port_combo_layout)
         port_layout.addWidget(self.connection_status)
-        self.refresh_ports()
+        # No refresh_ports() here: open_settings_panel does it right after
+        # construction, so the panel appears before ports are enumerated
 
         # Tags Management Section
         tags_group = QGroupBox("Allowed Tags")
@@ -276,6 +884,10 @@ class RFIDApp(QMainWindow):
         self.tag_list = QListWidget()
         self.tag_list.setObjectName("tagList")
         self.tag_list.setMinimumHeight(140)
+        # Single-line rows: constant-height layout, paint big sets in batches
+        self.tag_list.setUniformItemSizes(True)
+        self.tag_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.tag_list.setBatchSize(50)
         self.load_tags()
         
         # Add tag section
@@ -316,15 +928,6 @@ class RFIDApp(QMainWindow):
 
         self.main_layout.addWidget(self.settings_panel)
 
-        # Connect signals
-        self.settings_btn.clicked.connect(self.open_settings_panel)
-
-        # Install event filter for keyboard
-        self.installEventFilter(self)
-        
-        # Show main screen
-        self.show_main_screen()
-
     def set_dark_palette(self):
         palette = QPalette()
         
@@ -343,378 +946,17 @@ class RFIDApp(QMainWindow):
         palette.setColor(QPalette.ColorRole.HighlightedText, QColor(255, 255, 255))
         
         self.setPalette(palette)
-        self.setStyleSheet(self.get_stylesheet())
-
-    def get_stylesheet(self):
-        return """
-            /* Main Window */
-            QMainWindow {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                                            stop:0 rgba(18, 18, 28, 220), 
-                                            stop:1 rgba(28, 28, 48, 220));
-                border: 1px solid rgba(70, 70, 100, 100);
-                border-radius: 15px;
-            }
-            
-            /* Main Screen */
-            QWidget#mainScreen {
-                background: transparent;
-                border-radius: 15px;
-            }
-            
-            /* Settings Panel - NO BACKGROUND */
-            QWidget#settingsPanel {
-                background: transparent;
-                border-radius: 15px;
-            }
-            
-            /* Scroll Area Content - Remove all backgrounds */
-            QWidget#scrollContent {
-                background: transparent;
-            }
-            
-            /* Footer Label */
-            QLabel#footerLabel {
-                font-size: 10px;
-                color: rgba(255, 255, 255, 100);
-                font-style: italic;
-                padding: 5px;
-            }
-            
-            /* Settings Title - PROPERLY CENTERED */
-            QLabel#settingsTitle {
-                font-size: 22px;
-                font-weight: bold;
-                color: #ffffff;
-                padding: 0px;
-                margin: 0px;
-                qproperty-alignment: AlignCenter;
-            }
-            
-            /* Settings Button */
-            QPushButton#settingsBtn {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #2d3436, stop:1 #222831);
-                color: #ffffff;
-                font-size: 18px;
-                border: 1px solid #4a4a6a;
-                border-radius: 8px;
-                padding: 0px;
-            }
-            
-            QPushButton#settingsBtn:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #3742fa, stop:1 #5352ed);
-                border-color: #70a1ff;
-            }
-            
-            /* Status Indicator */
-            QLabel#statusIndicator {
-                font-size: 11px;
-                padding: 4px 10px;
-                border-radius: 8px;
-                background-color: #ff4757;
-                color: white;
-                font-weight: bold;
-            }
-            
-            /* Status Card */
-            QFrame#statusCard {
-                background: qradialgradient(cx:0.5, cy:0.5, radius:1,
-                                            fx:0.5, fy:0.5,
-                                            stop:0 rgba(40, 40, 60, 200),
-                                            stop:1 rgba(25, 25, 40, 250));
-                border-radius: 12px;
-                border: 1px solid #2d3436;
-            }
-            
-            /* Scan Icon */
-            QLabel#scanIcon {
-                font-size: 48px;
-                color: #70a1ff;
-                background: transparent;
-                border: none;
-                padding: 0px;
-                margin: 0px;
-            }
-            
-            /* Scan Label */
-            QLabel#scanLabel {
-                font-size: 17px;
-                font-weight: bold;
-                color: #ffffff;
-                padding: 4px;
-                background: transparent;
-            }
-            
-            /* Tag Display */
-            QLabel#tagDisplay {
-                font-size: 13px;
-                font-family: 'Courier New', monospace;
-                color: #70a1ff;
-                padding: 5px 8px;
-                background-color: rgba(30, 30, 45, 0.8);
-                border-radius: 5px;
-                border: 1px solid #3742fa;
-            }
-            
-            /* Combined Scan Control Button */
-            QPushButton#scanControlBtn {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #3742fa, stop:1 #5352ed);
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-                border: none;
-                border-radius: 8px;
-            }
-            
-            QPushButton#scanControlBtn:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #5352ed, stop:1 #6c5ce7);
-            }
-            
-            QPushButton#scanControlBtn:disabled {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #4a4a4a, stop:1 #3a3a3a);
-                color: #777777;
-            }
-            
-            /* Activity Label */
-            QLabel#activityLabel {
-                font-size: 13px;
-                font-weight: bold;
-                color: #70a1ff;
-                padding: 3px 0;
-            }
-            
-            /* Activity List */
-            QListWidget#activityList {
-                background-color: rgba(30, 30, 45, 0.8);
-                border: 1px solid #2d3436;
-                border-radius: 8px;
-                font-size: 10px;
-                padding: 5px;
-                color: #dddddd;
-            }
-            
-            QListWidget#activityList::item {
-                padding: 3px;
-                border-bottom: 1px solid rgba(45, 52, 54, 0.5);
-                background-color: transparent;
-            }
-            
-            QListWidget#activityList::item:last-child {
-                border-bottom: none;
-            }
-            
-            QListWidget#activityList::item:selected {
-                background-color: rgba(112, 161, 255, 0.3);
-                color: white;
-            }
-            
-            /* Back Button */
-            QPushButton#backBtn {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #2d3436, stop:1 #222831);
-                color: #70a1ff;
-                font-size: 18px;
-                border: 1px solid #4a4a6a;
-                border-radius: 8px;
-            }
-            
-            QPushButton#backBtn:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #3742fa, stop:1 #5352ed);
-                border-color: #70a1ff;
-            }
-            
-            /* Scroll Area */
-            QScrollArea#scrollArea {
-                border: none;
-                background: transparent;
-            }
-            
-            QScrollBar:vertical {
-                background: #2d3436;
-                width: 6px;
-                border-radius: 3px;
-            }
-            
-            QScrollBar::handle:vertical {
-                background: #70a1ff;
-                border-radius: 3px;
-                min-height: 15px;
-            }
-            
-            QScrollBar::handle:vertical:hover {
-                background: #5352ed;
-            }
-            
-            /* Settings Group Box - Keep the box styling but remove surrounding gray */
-            QGroupBox#settingsGroupBox {
-                font-size: 13px;
-                font-weight: bold;
-                color: #ffffff;
-                border: 2px solid #2d3436;
-                border-radius: 10px;
-                padding: 12px;
-                color: #70a1ff;
-                margin-top: 5px;
-                background: qradialgradient(cx:0.5, cy:0.5, radius:1,
-                                            fx:0.5, fy:0.5,
-                                            stop:0 rgba(40, 40, 60, 180),
-                                            stop:1 rgba(25, 25, 40, 200));
-            }
-            
-            QGroupBox#settingsGroupBox::title {
-                color: #70a1ff;
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 10px 0 10px;
-            }
-            
-            /* Combo Box */
-            QComboBox {
-                background-color: rgba(40, 40, 60, 0.8);
-                border: 1px solid #4a4a6a;
-                border-radius: 6px;
-                padding: 6px;
-                font-size: 11px;
-                color: #ffffff;
-            }
-            
-            QComboBox:hover {
-                border-color: #70a1ff;
-            }
-            
-            QComboBox::drop-down {
-                border: none;
-            }
-            
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 4px solid #70a1ff;
-            }
-            
-            QComboBox QAbstractItemView {
-                background-color: #1a1a2e;
-                border: 1px solid #70a1ff;
-                color: #ffffff;
-                selection-background-color: #3742fa;
-            }
-            
-            /* Refresh Button */
-            QPushButton#refreshBtn {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #3742fa, stop:1 #5352ed);
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-size: 14px;
-            }
-            
-            QPushButton#refreshBtn:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #5352ed, stop:1 #6c5ce7);
-            }
-            
-            /* Connection Status */
-            QLabel#connectionStatus {
-                color: #7f8c8d;
-                font-size: 10px;
-                font-style: italic;
-            }
-            
-            /* Tag List */
-            QListWidget#tagList {
-                background-color: rgba(40, 40, 60, 0.8);
-                border: 1px solid #4a4a6a;
-                border-radius: 6px;
-                font-size: 11px;
-                padding: 5px;
-                color: #dddddd;
-            }
-            
-            QListWidget#tagList::item {
-                padding: 5px;
-                background-color: rgba(30, 30, 45, 0.6);
-                margin: 2px;
-                border-radius: 4px;
-                border-left: 3px solid #3742fa;
-            }
-            
-            QListWidget#tagList::item:selected {
-                background-color: rgba(112, 161, 255, 0.3);
-                color: white;
-                border-left: 3px solid #ff6b6b;
-            }
-            
-            /* Line Edit */
-            QLineEdit {
-                background-color: rgba(40, 40, 60, 0.8);
-                border: 1px solid #4a4a6a;
-                border-radius: 6px;
-                padding: 6px;
-                font-size: 11px;
-                color: #ffffff;
-                selection-background-color: #3742fa;
-            }
-            
-            QLineEdit:focus {
-                border-color: #70a1ff;
-                border-width: 2px;
-            }
-            
-            QLineEdit::placeholder {
-                color: #7f8c8d;
-            }
-            
-            /* Add Button */
-            QPushButton#addBtn {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #1dd1a1, stop:1 #10ac84);
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-weight: bold;
-                padding: 0 12px;
-                font-size: 11px;
-            }
-            
-            QPushButton#addBtn:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #26de85, stop:1 #20bf6b);
-            }
-            
-            /* Remove Button */
-            QPushButton#removeBtn {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #ff6b6b, stop:1 #ee5a52);
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            
-            QPushButton#removeBtn:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #ff5252, stop:1 #ff3838);
-            }
-            
-            QPushButton#removeBtn:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #c0392b, stop:1 #a93226);
-            }
-        """
+        self.setStyleSheet(_STYLESHEET)
 
     # -------------------------
     # Scanning Mode
     # -------------------------
+    def _set_widget_state(self, widget, name, value):
+        """Flip a QSS dynamic property and repolish just that widget"""
+        widget.setProperty(name, value)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+
     def toggle_scanning(self):
         if self.scanning_enabled:
             self.disable_scanning()
@@ -722,48 +964,32 @@ class RFIDApp(QMainWindow):
             self.enable_scanning()
 
     def enable_scanning(self):
-        com_text = self.port_combo.currentText()
-        if not com_text or "No ports" in com_text:
+        if self.settings_panel is None:
+            self.show_message_dialog("No Port", "Please select a valid COM port first.")
+            return
+        port = self.port_combo.currentData()
+        if not port:
             self.show_message_dialog("No Port", "Please select a valid COM port first.")
             return
 
         try:
-            port = com_text.split(" - ")[0]
             self.esp = serial.Serial(port, BAUD_RATE, timeout=1)
             time.sleep(0.5)
+            self._reader = RFIDReader(self.esp, self)
+            self._reader.tag_read.connect(self.check_tag,
+                                          Qt.ConnectionType.QueuedConnection)
+            self._reader.start()
+            self._writer = SerialWriter(self.esp, self)
+            self._writer.start()
             self.scanning_enabled = True
             self.scan_label.setText("SCANNING...")
             self.scan_icon.setText("🔍")
             self.status_indicator.setText("● Connected")
-            self.status_indicator.setStyleSheet("""
-                QLabel {
-                    font-size: 11px;
-                    padding: 4px 10px;
-                    border-radius: 8px;
-                    background-color: #1dd1a1;
-                    color: white;
-                    font-weight: bold;
-                }
-            """)
+            self._set_widget_state(self.status_indicator, "state", "connected")
             self.scan_control_btn.setText("⏹ Stop Scanning")
-            self.scan_control_btn.setStyleSheet("""
-                QPushButton#scanControlBtn {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                stop:0 #ff6b6b, stop:1 #ee5a52);
-                    color: white;
-                    font-size: 14px;
-                    font-weight: bold;
-                    border: none;
-                    border-radius: 8px;
-                }
-                
-                QPushButton#scanControlBtn:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                stop:0 #ff5252, stop:1 #ff3838);
-                }
-            """)
+            self._set_widget_state(self.scan_control_btn, "mode", "stop")
             self.connection_status.setText(f"Connected to {port}")
-            self.connection_status.setStyleSheet("color: #1dd1a1; font-weight: bold;")
+            self._set_widget_state(self.connection_status, "state", "connected")
             
             self.add_activity("📡 Scanning started", "success")
             
@@ -774,6 +1000,14 @@ class RFIDApp(QMainWindow):
 
     def disable_scanning(self):
         self.scanning_enabled = False
+        if self._reader:
+            self._reader.stop()
+            self._reader.wait(2000)
+            self._reader = None
+        if self._writer:
+            self._writer.stop()
+            self._writer.wait(2000)
+            self._writer = None
         if self.esp:
             self.esp.close()
             self.esp = None
@@ -781,34 +1015,12 @@ class RFIDApp(QMainWindow):
         self.scan_label.setText("READY TO SCAN")
         self.scan_icon.setText("📱")
         self.status_indicator.setText("● Disconnected")
-        self.status_indicator.setStyleSheet("""
-            QLabel {
-                font-size: 11px;
-                padding: 4px 10px;
-                border-radius: 8px;
-                background-color: #ff4757;
-                color: white;
-                font-weight: bold;
-            }
-        """)
+        self._set_widget_state(self.status_indicator, "state", "disconnected")
         self.scan_control_btn.setText("▶ Start Scanning")
-        self.scan_control_btn.setStyleSheet("""
-            QPushButton#scanControlBtn {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #3742fa, stop:1 #5352ed);
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-                border: none;
-                border-radius: 8px;
-            }
-            
-            QPushButton#scanControlBtn:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #5352ed, stop:1 #6c5ce7);
-            }
-        """)
-        self.buffer = ""
+        self._set_widget_state(self.scan_control_btn, "mode", "start")
+        self.connection_status.setText("Select a port")
+        self._set_widget_state(self.connection_status, "state", "disconnected")
+        self.buffer.clear()
         self.tag_display.setText("")
         
         self.add_activity("⏹️ Scanning stopped", "info")
@@ -817,9 +1029,15 @@ class RFIDApp(QMainWindow):
     # Custom Message Dialogs (Consistent Theming)
     # -------------------------
     def show_message_dialog(self, title, message, is_error=False):
-        """Show a themed message dialog"""
+        """Show a themed message dialog (built once, reused)"""
+        if self._message_dialog is None:
+            self._build_message_dialog()
+        self._message_dialog.setWindowTitle(title)
+        self._message_dialog_label.setText(message)
+        self._message_dialog.exec()
+
+    def _build_message_dialog(self):
         dialog = QDialog(self)
-        dialog.setWindowTitle(title)
         dialog.setFixedSize(400, 180)
         dialog.setWindowFlags(Qt.WindowType.Dialog | Qt.WindowType.CustomizeWindowHint | 
                             Qt.WindowType.WindowTitleHint | Qt.WindowType.WindowCloseButtonHint)
@@ -859,177 +1077,186 @@ class RFIDApp(QMainWindow):
         layout = QVBoxLayout(dialog)
         layout.setContentsMargins(30, 30, 30, 30)
         layout.setSpacing(20)
-        
+
         # Message label
-        msg_label = QLabel(message)
+        msg_label = QLabel("")
         msg_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         msg_label.setWordWrap(True)
-        
+
         # OK button
         ok_btn = QPushButton("OK")
         ok_btn.setFixedSize(100, 35)
         ok_btn.clicked.connect(dialog.accept)
-        
+
         button_layout = QHBoxLayout()
         button_layout.addStretch()
         button_layout.addWidget(ok_btn)
         button_layout.addStretch()
-        
+
         layout.addWidget(msg_label)
         layout.addLayout(button_layout)
-        
-        dialog.exec()
+
+        self._message_dialog = dialog
+        self._message_dialog_label = msg_label
 
     # -------------------------
     # Event Filter (Keyboard RFID)
     # -------------------------
     def eventFilter(self, obj, event):
-        if self.scanning_enabled and event.type() == QEvent.Type.KeyPress:
-            key = event.key()
+        # Cheap type check first: paint/timer/mouse events all bail here
+        # before touching any Python attribute (base eventFilter returns
+        # False, so this short-circuit is equivalent to chaining up)
+        if event.type() != QEvent.Type.KeyPress or not self.scanning_enabled:
+            return False
+        key = event.key()
 
-            if Qt.Key.Key_0 <= key <= Qt.Key.Key_9:
-                self.buffer += event.text()
-                self.tag_display.setText(self.buffer)
-                self.scan_icon.setText("⌨️")
+        if Qt.Key.Key_0 <= key <= Qt.Key.Key_9:
+            # bytearray append is amortized O(1); str += copies the buffer.
+            # Display refresh is deferred so a scanner burst repaints once.
+            self.buffer.extend(event.text().encode('ascii', 'ignore'))
+            self._buffer_timer.start()
 
-            if key == Qt.Key.Key_Return:
-                tag = self.buffer
-                self.buffer = ""
-                self.tag_display.setText("")
-                self.check_tag(tag)
+        if key == Qt.Key.Key_Return:
+            self._buffer_timer.stop()
+            tag = self.buffer.decode('ascii', 'ignore')
+            self.buffer.clear()
+            self.tag_display.setText("")
+            self.check_tag(tag)
 
         return super().eventFilter(obj, event)
 
+    def _flush_buffer_display(self):
+        """Show the accumulated keystrokes after a burst settles"""
+        self.tag_display.setText(self.buffer.decode('ascii', 'ignore'))
+        self.scan_icon.setText("⌨️")
+
     # -------------------------
     # Tag validation
     # -------------------------
     def check_tag(self, tag):
-        if not tag:  # Empty tag
-            self.show_tag_result("EMPTY TAG", False)
-            self.add_activity(f"❌ Empty tag", "error")
-            return
-            
-        if tag in self.allowed_tags:
-            self.show_tag_result(f"ACCESS GRANTED\n{tag}", True)
-            if self.esp:
-                self.esp.write(b"open\n")
-            self.add_activity(f"✅ Access granted: {tag}", "success")
+        # Real tag first: this is the hot path; the empty frame is rare
+        if tag:
+            # Interned canonical form lets the set probe short-circuit on
+            # identity when the tag is allowed
+            canon = sys.intern(_canon(tag))
+            # Bloom prefilter: a negative answer is definitive, so most
+            # denied scans never touch the tag set at all
+            if self._bloom_might_contain(canon) and canon in self.allowed_tags:
+                self.show_tag_result(f"ACCESS GRANTED\n{tag}", True)
+                if self._writer:
+                    self._writer.send(b"open\n")
+                self.add_activity(f"✅ Access granted: {tag}", "success")
+            else:
+                self.show_tag_result(f"ACCESS DENIED\n{tag}", False)
+                self.add_activity(f"❌ Access denied: {tag}", "error")
         else:
-            self.show_tag_result(f"ACCESS DENIED\n{tag}", False)
-            self.add_activity(f"❌ Access denied: {tag}", "error")
+            self.show_tag_result("EMPTY TAG", False)
+            self.add_activity("❌ Empty tag", "error")
 
     def show_tag_result(self, text, success):
         color = "#1dd1a1" if success else "#ff4757"
         icon = "✅" if success else "❌"
         status = "ACCESS GRANTED" if success else "ACCESS DENIED"
-        
+
         self.scan_label.setText(status)
-        self.scan_label.setStyleSheet(f"""
-            font-size: 15px;
-            font-weight: bold;
-            color: {color};
-            padding: 4px;
-            background: transparent;
-        """)
+        self.scan_label.setStyleSheet(self._scan_label_qss[success])
         self.scan_icon.setText(icon)
-        self.scan_icon.setStyleSheet(f"""
-            font-size: 48px;
-            color: {color};
-            background: transparent;
-            border: none;
-            padding: 0px;
-            margin: 0px;
-        """)
-        
+        self.scan_icon.setStyleSheet(self._scan_icon_qss[success])
+
         # Show tag ID if available
         if "\n" in text:
             tag_id = text.split('\n')[1]
             self.tag_display.setText(tag_id)
         else:
             self.tag_display.setText("")
-            
-        self.tag_display.setStyleSheet(f"""
-            color: {color};
-            border-color: {color};
-            background-color: rgba(30, 30, 45, 0.8);
-        """)
+
+        self.tag_display.setStyleSheet(self._tag_display_qss[success])
         
         # Pulse animation effect
         self.pulse_animation(color)
-        
-        # Reset after 2 seconds
-        QTimer.singleShot(2000, self.reset_scan_display)
+
+        # Reset after 2 seconds (restarts if a scan is already pending)
+        self._reset_timer.start()
 
     def pulse_animation(self, color):
-        animation = QPropertyAnimation(self.scan_icon, b"styleSheet")
-        animation.setDuration(300)
-        animation.setLoopCount(2)
-        animation.setStartValue(f"font-size: 48px; color: {color}; background: transparent;")
-        animation.setKeyValueAt(0.5, f"font-size: 56px; color: {color}; background: transparent;")
-        animation.setEndValue(f"font-size: 48px; color: {color}; background: transparent;")
-        animation.start(QAbstractAnimation.DeletionPolicy.DeleteWhenStopped)
+        # Animate the numeric font size instead of the styleSheet property,
+        # which forced a full CSS reparse on every frame
+        self._pulse_anim.stop()
+        self._pulse_color = color
+        self._pulse_anim.start()
+
+    def _pulse_tick(self, size):
+        self.scan_icon.setStyleSheet(_ICON_TMPL % (size, self._pulse_color))
 
     def reset_scan_display(self):
         if self.scanning_enabled:
             self.scan_label.setText("SCANNING...")
-            self.scan_label.setStyleSheet("""
-                font-size: 17px;
-                font-weight: bold;
-                color: #ffffff;
-                padding: 4px;
-                background: transparent;
-            """)
+            self.scan_label.setStyleSheet(self._scan_label_qss[None])
             self.scan_icon.setText("🔍")
-            self.scan_icon.setStyleSheet("""
-                font-size: 48px;
-                color: #70a1ff;
-                background: transparent;
-                border: none;
-                padding: 0px;
-                margin: 0px;
-            """)
+            self.scan_icon.setStyleSheet(self._scan_icon_qss[None])
             self.tag_display.setText("")
-            self.tag_display.setStyleSheet("""
-                color: #70a1ff;
-                border-color: #3742fa;
-                background-color: rgba(30, 30, 45, 0.8);
-            """)
+            self.tag_display.setStyleSheet(self._tag_display_qss[None])
 
     def add_activity(self, message, type_="info"):
-        timestamp = time.strftime("%H:%M:%S")
-        item = QListWidgetItem(f"[{timestamp}] {message}")
-        
-        if type_ == "success":
-            item.setForeground(QColor("#1dd1a1"))
-        elif type_ == "error":
-            item.setForeground(QColor("#ff4757"))
-        elif type_ == "info":
-            item.setForeground(QColor("#70a1ff"))
-            
+        # strftime does TZ lookup and formatting; reuse within the same second
+        sec = int(time.time())
+        if sec != self._ts_last_sec:
+            self._ts_str = time.strftime("%H:%M:%S", time.localtime(sec))
+            self._ts_last_sec = sec
+        item = QListWidgetItem(f"[{self._ts_str}] {message}")
+
+        color = self._activity_colors.get(type_)
+        if color is not None:
+            item.setForeground(color)
+
         self.activity_list.insertItem(0, item)
-        
-        # Keep only last 6 items (more compact)
-        if self.activity_list.count() > 6:
-            self.activity_list.takeItem(6)
+
+        # Ring-buffer behaviour: drop the oldest entries past the cap
+        while self.activity_list.count() > 200:
+            self.activity_list.model().removeRow(self.activity_list.count() - 1)
 
     # -------------------------
     # SETTINGS LOGIC
     # -------------------------
     def refresh_ports(self):
+        now = time.monotonic()
+        cached_at, cached_ports = self._ports_cache
+        if now - cached_at < 2.0:
+            ports = cached_ports
+        else:
+            ports = list(serial.tools.list_ports.comports())
+            self._ports_cache = (now, ports)
+
+        # Only reset the combo when the set of devices actually changed
+        devices = tuple(p.device for p in ports)
+        if devices == self._ports_shown:
+            return
+        self._ports_shown = devices
+
         self.port_combo.clear()
-        ports = list(serial.tools.list_ports.comports())
         if not ports:
             self.port_combo.addItem("No ports available")
             self.port_combo.setEnabled(False)
         else:
             for p in ports:
-                self.port_combo.addItem(f"{p.device} - {p.description}")
+                # Keep the device path as item data so no display-text parsing
+                # is needed when connecting
+                self.port_combo.addItem(f"{p.device} - {p.description}", p.device)
             self.port_combo.setEnabled(True)
 
     def load_tags(self):
+        # Nothing changed since the last rebuild: keep the current widgets
+        if self._tag_list_version == self._tags_version:
+            return
+        self._tag_list_version = self._tags_version
+
+        # One batched insert instead of a model signal per tag
+        self.tag_list.setUpdatesEnabled(False)
+        self.tag_list.blockSignals(True)
         self.tag_list.clear()
-        for tag in self.allowed_tags:
-            self.tag_list.addItem(tag)
+        self.tag_list.addItems(sorted(self.allowed_tags))
+        self.tag_list.blockSignals(False)
+        self.tag_list.setUpdatesEnabled(True)
 
     def add_new_tag(self):
         tag = self.new_tag_input.text().strip()
@@ -1037,7 +1264,7 @@ class RFIDApp(QMainWindow):
             self.show_message_dialog("Empty Tag", "Please enter a tag ID.")
             return
             
-        if tag in self.allowed_tags:
+        if _canon(tag) in self.allowed_tags:
             self.show_message_dialog("Duplicate Tag", "This tag is already in the list.")
             return
         
@@ -1051,134 +1278,136 @@ class RFIDApp(QMainWindow):
 
     def remove_selected_tag(self):
         selected = self.tag_list.currentItem()
-        if selected:
-            tag = selected.text()
-            
-            # Create custom dialog with app theme
-            dialog = QDialog(self)
-            dialog.setWindowTitle("")
-            dialog.setFixedSize(380, 180)
-            dialog.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.Dialog)
-            
-            # Match app theme
-            dialog.setStyleSheet("""
-                QDialog {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                                                stop:0 rgba(13, 13, 21, 220), 
-                                                stop:1 rgba(26, 26, 46, 220));
-                    border: 2px solid #ff4757;
-                    border-radius: 12px;
-                }
-                QLabel {
-                    color: #ffffff;
-                    font-size: 15px;
-                    font-weight: bold;
-                    padding: 8px;
-                    background: transparent;
-                }
-            """)
-            
-            # Layout
-            layout = QVBoxLayout(dialog)
-            layout.setContentsMargins(25, 25, 25, 25)
-            layout.setSpacing(20)
-            
-            # Message label
-            message = QLabel(f"Remove tag '{tag}'?")
-            message.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            message.setWordWrap(True)
-            
-            # Button layout
-            button_layout = QHBoxLayout()
-            button_layout.setSpacing(25)
-            
-            # No button
-            no_btn = QPushButton("NO")
-            no_btn.setFixedSize(100, 40)
-            no_btn.setStyleSheet("""
-                QPushButton {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                stop:0 #3742fa, stop:1 #5352ed);
-                    color: white;
-                    font-size: 13px;
-                    font-weight: bold;
-                    border: none;
-                    border-radius: 8px;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                stop:0 #5352ed, stop:1 #6c5ce7);
-                    border: 2px solid #70a1ff;
-                }
-                QPushButton:pressed {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                stop:0 #2c34c9, stop:1 #1a23a5);
-                }
-            """)
-            
-            # Yes button
-            yes_btn = QPushButton("YES")
-            yes_btn.setFixedSize(100, 40)
-            yes_btn.setStyleSheet("""
-                QPushButton {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                stop:0 #ff6b6b, stop:1 #ee5a52);
-                    color: white;
-                    font-size: 13px;
-                    font-weight: bold;
-                    border: none;
-                    border-radius: 8px;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                stop:0 #ff5252, stop:1 #ff3838);
-                    border: 2px solid #ff6b6b;
-                }
-                QPushButton:pressed {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                stop:0 #c0392b, stop:1 #a93226);
-                }
-            """)
-            
-            button_layout.addStretch()
-            button_layout.addWidget(no_btn)
-            button_layout.addWidget(yes_btn)
-            button_layout.addStretch()
-            
-            # Connect buttons
-            def on_yes():
-                try:
-                    # Remove from JSON file and memory
-                    if self.remove_tag_from_json(tag):
-                        self.tag_list.takeItem(self.tag_list.row(selected))
-                        self.add_activity(f"🗑️ Tag removed: {tag}", "info")
-                    else:
-                        self.add_activity(f"⚠️ Failed to remove: {tag}", "error")
-                except ValueError:
-                    pass  # Tag was already removed
-                dialog.accept()
-            
-            def on_no():
+        if not selected:
+            return
+        if self._remove_dialog is None:
+            self._build_remove_dialog()
+        self._pending_remove_tag = selected.text()
+        self._pending_remove_item = selected
+        self._remove_dialog_label.setText(f"Remove tag '{self._pending_remove_tag}'?")
+        self._remove_dialog.exec()
+
+    def _confirm_remove(self):
+        tag = self._pending_remove_tag
+        # Remove from JSON file and memory
+        if self.remove_tag_from_json(tag):
+            self.tag_list.takeItem(self.tag_list.row(self._pending_remove_item))
+            self.add_activity(f"\U0001f5d1\ufe0f Tag removed: {tag}", "info")
+        else:
+            self.add_activity(f"\u26a0\ufe0f Failed to remove: {tag}", "error")
+        self._remove_dialog.accept()
+
+    def _build_remove_dialog(self):
+        """Construct the themed remove-confirmation dialog once"""
+        dialog = QDialog(self)
+        dialog.setWindowTitle("")
+        dialog.setFixedSize(380, 180)
+        dialog.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.Dialog)
+
+        # Match app theme
+        dialog.setStyleSheet("""
+            QDialog {
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                                            stop:0 rgba(13, 13, 21, 220), 
+                                            stop:1 rgba(26, 26, 46, 220));
+                border: 2px solid #ff4757;
+                border-radius: 12px;
+            }
+            QLabel {
+                color: #ffffff;
+                font-size: 15px;
+                font-weight: bold;
+                padding: 8px;
+                background: transparent;
+            }
+        """)
+
+        # Layout
+        layout = QVBoxLayout(dialog)
+        layout.setContentsMargins(25, 25, 25, 25)
+        layout.setSpacing(20)
+
+        # Message label
+        message = QLabel("")
+        message.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        message.setWordWrap(True)
+
+        # Button layout
+        button_layout = QHBoxLayout()
+        button_layout.setSpacing(25)
+
+        # No button
+        no_btn = QPushButton("NO")
+        no_btn.setFixedSize(100, 40)
+        no_btn.setStyleSheet("""
+            QPushButton {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                            stop:0 #3742fa, stop:1 #5352ed);
+                color: white;
+                font-size: 13px;
+                font-weight: bold;
+                border: none;
+                border-radius: 8px;
+            }
+            QPushButton:hover {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                            stop:0 #5352ed, stop:1 #6c5ce7);
+                border: 2px solid #70a1ff;
+            }
+            QPushButton:pressed {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                            stop:0 #2c34c9, stop:1 #1a23a5);
+            }
+        """)
+
+        # Yes button
+        yes_btn = QPushButton("YES")
+        yes_btn.setFixedSize(100, 40)
+        yes_btn.setStyleSheet("""
+            QPushButton {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                            stop:0 #ff6b6b, stop:1 #ee5a52);
+                color: white;
+                font-size: 13px;
+                font-weight: bold;
+                border: none;
+                border-radius: 8px;
+            }
+            QPushButton:hover {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                            stop:0 #ff5252, stop:1 #ff3838);
+                border: 2px solid #ff6b6b;
+            }
+            QPushButton:pressed {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                            stop:0 #c0392b, stop:1 #a93226);
+            }
+        """)
+
+        button_layout.addStretch()
+        button_layout.addWidget(no_btn)
+        button_layout.addWidget(yes_btn)
+        button_layout.addStretch()
+
+        # Connect buttons
+        yes_btn.clicked.connect(self._confirm_remove)
+        no_btn.clicked.connect(dialog.reject)
+
+        # Also close on Escape key
+        def on_key_press(event):
+            if event.key() == Qt.Key.Key_Escape:
                 dialog.reject()
-            
-            yes_btn.clicked.connect(on_yes)
-            no_btn.clicked.connect(on_no)
-            
-            # Also close on Escape key
-            def on_key_press(event):
-                if event.key() == Qt.Key.Key_Escape:
-                    dialog.reject()
-                else:
-                    QDialog.keyPressEvent(dialog, event)
-            
-            dialog.keyPressEvent = on_key_press
-            
-            # Add widgets to dialog
-            layout.addWidget(message)
-            layout.addLayout(button_layout)
-            
-            # Show dialog centered
-            dialog.exec()
+            else:
+                QDialog.keyPressEvent(dialog, event)
+
+        dialog.keyPressEvent = on_key_press
+
+        # Add widgets to dialog
+        layout.addWidget(message)
+        layout.addLayout(button_layout)
+
+        self._remove_dialog = dialog
+        self._remove_dialog_label = message
 
     # -------------------------
     # Page Navigation
@@ -1187,6 +1416,8 @@ class RFIDApp(QMainWindow):
         self.main_layout.setCurrentWidget(self.main_screen)
 
     def open_settings_panel(self):
+        if self.settings_panel is None:
+            self._build_settings_panel()
         self.main_layout.setCurrentWidget(self.settings_panel)
         self.refresh_ports()
         self.load_tags()
@@ -1195,6 +1426,13 @@ class RFIDApp(QMainWindow):
         self.show_main_screen()
 
     def closeEvent(self, event):
+        self._flush_tags()
+        if self._reader:
+            self._reader.stop()
+            self._reader.wait(2000)
+        if self._writer:
+            self._writer.stop()
+            self._writer.wait(2000)
         if self.esp:
             self.esp.close()
         event.accept()